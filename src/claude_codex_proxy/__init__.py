@@ -3,29 +3,47 @@ Claude & Codex API Proxy - Universal HTTP proxy and Python library for routing
 Anthropic, OpenAI, and Gemini API calls to local CLI tools.
 """
 
-from .anthropic_router import (
-    AnthropicRouter,
-    AsyncAnthropicRouter,
-    create_client,
-)
-from .openai_router import (
-    OpenAIRouter,
-    AsyncOpenAIRouter,
-    create_openai_client,
-)
-from .gemini_router import (
-    GenerativeModel,
-    configure as configure_gemini,
-)
-from .claude_code_client import ClaudeCodeClient
-from .codex_client import CodexClient
-from .gemini_client import GeminiClient
-from .utils import (
-    is_all_nines_api_key,
-    CLIError,
-    CLINotFoundError,
-    CLITimeoutError,
-)
+import importlib
+
+# Public names mapped to (submodule, attribute). Submodules are imported on
+# first access so that, e.g., OpenAI-only users never load the Gemini SDK.
+_LAZY_ATTRS = {
+    # Anthropic routing
+    "AnthropicRouter": (".anthropic_router", "AnthropicRouter"),
+    "AsyncAnthropicRouter": (".anthropic_router", "AsyncAnthropicRouter"),
+    "create_client": (".anthropic_router", "create_client"),
+    # OpenAI routing
+    "OpenAIRouter": (".openai_router", "OpenAIRouter"),
+    "AsyncOpenAIRouter": (".openai_router", "AsyncOpenAIRouter"),
+    "create_openai_client": (".openai_router", "create_openai_client"),
+    # Gemini routing
+    "GenerativeModel": (".gemini_router", "GenerativeModel"),
+    "configure_gemini": (".gemini_router", "configure"),
+    # Clients
+    "ClaudeCodeClient": (".claude_code_client", "ClaudeCodeClient"),
+    "CodexClient": (".codex_client", "CodexClient"),
+    "GeminiClient": (".gemini_client", "GeminiClient"),
+    # Utilities
+    "is_all_nines_api_key": (".utils", "is_all_nines_api_key"),
+    "CLIError": (".utils", "CLIError"),
+    "CLINotFoundError": (".utils", "CLINotFoundError"),
+    "CLITimeoutError": (".utils", "CLITimeoutError"),
+}
+
+
+def __getattr__(name):
+    try:
+        module_name, attr = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
 
 __version__ = "0.1.0"
 
@@ -2,20 +2,38 @@
 """Cross-platform launcher for Anthropic API proxy server."""
 import argparse
 import asyncio
+import functools
 import logging
 import shutil
 import sys
 import os
+from typing import Dict, Optional
 
-from dotenv import load_dotenv
+# Launcher settings looked up from the environment
+PROXY_ENV_KEYS = ("ALLOWED_PATHS", "GOOGLE_API_KEY", "GEMINI_API_KEY")
 
-# Load environment variables from .env file
-load_dotenv()
+
+def load_proxy_env() -> Dict[str, str]:
+    """Apply the .env file once and snapshot the launcher's settings."""
+    from .utils import load_env
+
+    load_env()
+    return {
+        k: v
+        for k, v in os.environ.items()
+        if k.startswith("PROXY_") or k in PROXY_ENV_KEYS
+    }
+
+
+@functools.lru_cache(maxsize=16)
+def _which(cmd: str, path: Optional[str]) -> Optional[str]:
+    """Resolve a command against a PATH value, caching the result."""
+    return shutil.which(cmd, path=path)
 
 
 def command_exists(cmd: str) -> bool:
     """Check if a command exists on PATH."""
-    return shutil.which(cmd) is not None
+    return _which(cmd, os.environ.get("PATH")) is not None
 
 
 def ensure_dependencies() -> None:
@@ -26,10 +44,22 @@ def ensure_dependencies() -> None:
         print("⚠️  Warning: Codex CLI not found; codex routing will fail.")
 
 
+def run_event_loop(coro) -> None:
+    """Run a coroutine on uvloop when it is installed, else on asyncio."""
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(coro)
+    else:
+        uvloop.run(coro)
+
+
 def main() -> None:
+    proxy_env = load_proxy_env()
+
     parser = argparse.ArgumentParser(description="Anthropic API Proxy Server Launcher")
-    parser.add_argument("--host", default=os.environ.get("PROXY_HOST", "127.0.0.1"))
-    parser.add_argument("--port", type=int, default=int(os.environ.get("PROXY_PORT", "8080")))
+    parser.add_argument("--host", default=proxy_env.get("PROXY_HOST", "127.0.0.1"))
+    parser.add_argument("--port", type=int, default=int(proxy_env.get("PROXY_PORT", "8080")))
     parser.add_argument("-v", "--verbose", action="store_true", help="Enable verbose logging")
     parser.add_argument(
         "--allowed-paths",
@@ -50,7 +80,7 @@ def main() -> None:
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
-    override = args.allowed_paths or os.environ.get("ALLOWED_PATHS")
+    override = args.allowed_paths or proxy_env.get("ALLOWED_PATHS")
     if override:
         patterns = [p.strip() for p in override.split(",") if p.strip()]
     else:
@@ -60,7 +90,7 @@ def main() -> None:
     allowed_paths_regex = proxy_server.build_allowed_paths_regex(patterns)
 
     try:
-        asyncio.run(
+        run_event_loop(
             proxy_server.start_proxy(
                 args.host,
                 args.port,
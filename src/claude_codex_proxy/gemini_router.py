@@ -1,6 +1,8 @@
 """
 Gemini API Router that routes to Gemini CLI when API key is all 9s
 """
+import asyncio
+import functools
 import os
 from typing import Any, Dict, List, Optional, Union
 import google.generativeai as genai
@@ -10,28 +12,50 @@ from .gemini_client import GeminiClient
 
 # Global storage for the configured API key
 _configured_api_key: Optional[str] = None
+# Whether the configured key routes to the local Gemini CLI, set by configure()
+_IS_LOCAL_MODE: bool = False
 
 
 def _is_all_nines(api_key: Optional[str]) -> bool:
     """Check if the API key is all 9s."""
     if not api_key:
         return False
-    # Remove prefixes or query params if present (though typically just the key string)
-    return all(c == '9' for c in api_key)
+    # str.count is a single vectorised scan, faster than strip('9')
+    return api_key.count('9') == len(api_key)
+
+
+def _in_event_loop() -> bool:
+    """Check if the caller is running inside an asyncio event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+@functools.lru_cache(maxsize=1)
+def _get_local_client() -> GeminiClient:
+    """Return the process-wide GeminiClient shared by local-mode models."""
+    return GeminiClient()
 
 
 def configure(api_key: Optional[str] = None, **kwargs):
     """
     Configure the Gemini API.
     """
-    global _configured_api_key
+    global _configured_api_key, _IS_LOCAL_MODE
     _configured_api_key = api_key or os.environ.get("GOOGLE_API_KEY")
+    _IS_LOCAL_MODE = _is_all_nines(_configured_api_key)
 
     # Always configure the real library just in case, unless we want to prevent it
     # completely for bad keys. But typically we just mirror.
     # However, if it's all 9s, the real library might reject it if we call configure.
     # So we only call real configure if it's NOT all 9s.
-    if not _is_all_nines(_configured_api_key):
+    # The SDK keeps one transport client per service for the whole process and
+    # every genai.GenerativeModel borrows it, so connections are already
+    # pooled across wrapper instances; avoid calling configure() per request
+    # since that discards those clients.
+    if not _IS_LOCAL_MODE:
         genai.configure(api_key=_configured_api_key, **kwargs)
 
 
@@ -41,6 +65,18 @@ class GenerativeModel:
     when the configured API key is all 9s.
     """
 
+    __slots__ = (
+        "model_name",
+        "generation_config",
+        "safety_settings",
+        "tools",
+        "tool_config",
+        "system_instruction",
+        "_is_local_mode",
+        "client",
+        "_real_model",
+    )
+
     def __init__(
         self,
         model_name: str,
@@ -58,10 +94,10 @@ class GenerativeModel:
         self.system_instruction = system_instruction
 
         # Determine mode based on globally configured key
-        self._is_local_mode = _is_all_nines(_configured_api_key)
+        self._is_local_mode = _IS_LOCAL_MODE
 
         if self._is_local_mode:
-            self.client = GeminiClient()
+            self.client = _get_local_client()
             self._real_model = None
         else:
             self.client = None
@@ -74,6 +110,26 @@ class GenerativeModel:
                 system_instruction=system_instruction
             )
 
+    def _local_request_kwargs(
+        self,
+        contents: Union[str, List[Dict[str, Any]]],
+        generation_config: Optional[GenerationConfig],
+        stream: bool
+    ) -> Dict[str, Any]:
+        """
+        Build the GeminiClient arguments shared by the sync and async paths.
+        """
+        if stream:
+            raise NotImplementedError("Streaming not supported in local mode")
+
+        return {
+            "model": self.model_name,
+            "contents": contents,
+            # Per-call config overrides the one given at construction
+            "generation_config": generation_config or self.generation_config,
+            "stream": stream,
+        }
+
     def generate_content(
         self,
         contents: Union[str, List[Dict[str, Any]]],
@@ -87,19 +143,15 @@ class GenerativeModel:
         """
         if self._is_local_mode:
             # Use local Gemini Client
-            # Merge config if provided
-            config = generation_config or self.generation_config
-
-            if stream:
-                raise NotImplementedError("Streaming not supported in local mode")
-
             return self.client.generate_content(
-                model=self.model_name,
-                contents=contents,
-                generation_config=config,
-                stream=stream
+                **self._local_request_kwargs(contents, generation_config, stream)
             )
         else:
+            if stream and _in_event_loop():
+                # The SDK's sync stream blocks on every chunk
+                raise NotImplementedError(
+                    "Use generate_content_async(stream=True) inside an event loop"
+                )
             # Delegate to real library
             return self._real_model.generate_content(
                 contents,
@@ -121,15 +173,8 @@ class GenerativeModel:
         Async version of generate_content.
         """
         if self._is_local_mode:
-            config = generation_config or self.generation_config
-            if stream:
-                raise NotImplementedError("Streaming not supported in local mode")
-
             return await self.client.generate_content_async(
-                model=self.model_name,
-                contents=contents,
-                generation_config=config,
-                stream=stream
+                **self._local_request_kwargs(contents, generation_config, stream)
             )
         else:
             return await self._real_model.generate_content_async(
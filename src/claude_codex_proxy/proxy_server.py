@@ -5,6 +5,7 @@ Routes to Claude Code, Codex, or Gemini CLI when API keys are all 9s.
 Includes security improvements and bug fixes.
 """
 import asyncio
+import functools
 import json
 import logging
 import os
@@ -43,10 +44,19 @@ DEFAULT_ALLOWED_PATH_PATTERNS = [
     r'^/v1/.*'  # Fallback: allow any /v1/* endpoint
 ]
 
+# Upper bound on remembered allow/deny decisions per interceptor
+PATH_DECISION_CACHE_SIZE = 1024
+
+VALID_HOST_REGEX = re.compile(r'^[\d.]+$|^localhost$|^[\da-fA-F:]+$')
+
 
 def build_allowed_paths_regex(patterns):
-    """Compile a regex from a list of pattern strings."""
-    combined = "|".join(f"(?:{p})" for p in patterns)
+    """Compile a single alternation regex from a list of pattern strings.
+
+    Duplicate patterns (e.g. a default repeated via --allowed-path) are
+    dropped so each alternative is only tried once per match.
+    """
+    combined = "|".join(f"(?:{p})" for p in dict.fromkeys(patterns))
     return re.compile(combined)
 
 
@@ -62,6 +72,10 @@ class AIInterceptor:
         self.gemini_handler = GeminiProxyHandler()
         self.default_backend = default_backend
         self.allowed_paths_regex = allowed_paths_regex
+        # Clients hit the same handful of endpoints, so remember decisions
+        self._path_allowed = functools.lru_cache(maxsize=PATH_DECISION_CACHE_SIZE)(
+            self._match_allowed_path
+        )
         self.stats = {
             'total_requests': 0,
             'claude_code_routed': 0,
@@ -78,6 +92,10 @@ class AIInterceptor:
         """Check if API key is all 9s (indicating Claude Code routing)."""
         return is_all_nines_api_key(api_key)
 
+    def _match_allowed_path(self, path: str) -> bool:
+        """Check a request path against the allowed paths regex."""
+        return self.allowed_paths_regex.match(path) is not None
+
     def _is_anthropic_request(self, flow: http.HTTPFlow) -> bool:
         host = flow.request.pretty_host.lower()
         return host in ['api.anthropic.com', 'anthropic.com']
@@ -102,7 +120,7 @@ class AIInterceptor:
             }
 
         # Check path
-        if not self.allowed_paths_regex.match(flow.request.path):
+        if not self._path_allowed(flow.request.path):
             return {
                 "error": {
                     "type": "not_found",
@@ -504,7 +522,7 @@ async def start_proxy(
 ):
     """Start the mitmproxy server."""
     # Validate host and port
-    if not re.match(r'^[\d.]+$|^localhost$|^[\da-fA-F:]+$', host):
+    if not VALID_HOST_REGEX.match(host):
         raise ValueError(f"Invalid host: {host}")
     if not 1 <= port <= 65535:
         raise ValueError(f"Invalid port: {port}")
@@ -6,17 +6,19 @@ import subprocess
 from pathlib import Path
 from typing import Optional, List
 
-from dotenv import load_dotenv
-
 # Load environment variables from .env file
 # Search in current directory and parent directories
 _env_loaded = False
+# Set once .env has been applied so child processes and re-imports skip it
+ENV_LOADED_VAR = "CLAUDE_CODEX_ENV_LOADED"
 
 
 def load_env():
     """Load environment variables from .env file if not already loaded."""
     global _env_loaded
-    if not _env_loaded:
+    if not _env_loaded and not os.environ.get(ENV_LOADED_VAR):
+        from dotenv import load_dotenv
+
         # Try current directory first, then parent directories
         env_path = Path.cwd() / ".env"
         if env_path.exists():
@@ -24,7 +26,8 @@ def load_env():
         else:
             # Try to find .env in parent directories
             load_dotenv()
-        _env_loaded = True
+        os.environ[ENV_LOADED_VAR] = "1"
+    _env_loaded = True
 
 
 # Load env on module import
@@ -47,8 +50,8 @@ def is_all_nines_api_key(api_key: Optional[str]) -> bool:
     """Return True if the API key (after removing any prefix) is all 9s."""
     if not api_key:
         return False
-    key_part = api_key.split('-')[-1] if '-' in api_key else api_key
-    return all(c == '9' for c in key_part)
+    key_part = api_key.rpartition('-')[2]
+    return key_part.count('9') == len(key_part)
 
 
 def run_subprocess(cmd: List[str], input_text: str, name: str, *, timeout: int = 120,
@@ -58,7 +61,8 @@ def run_subprocess(cmd: List[str], input_text: str, name: str, *, timeout: int =
         result = subprocess.run(
             cmd,
             input=input_text,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE if include_stderr else subprocess.DEVNULL,
             text=True,
             timeout=timeout,
         )
@@ -72,8 +76,8 @@ def run_subprocess(cmd: List[str], input_text: str, name: str, *, timeout: int =
         raise CLIError(f"Error calling {name}: {str(e)}")
 
     if result.returncode != 0:
-        error_msg = result.stderr or "Unknown error"
         if include_stderr:
+            error_msg = result.stderr or "Unknown error"
             raise CLIError(f"{name} CLI error: {error_msg}")
         raise CLIError(f"{name} CLI error")
 
@@ -84,11 +88,13 @@ async def run_subprocess_async(cmd: List[str], input_text: str, name: str, *, ti
                                 include_stderr: bool = True) -> str:
     """Run a subprocess command asynchronously with timeout handling."""
     try:
+        # stderr is only read for error messages; when those are suppressed
+        # send it to /dev/null so the event loop drains a single pipe.
         proc = await asyncio.create_subprocess_exec(
             *cmd,
             stdin=asyncio.subprocess.PIPE,
             stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE if include_stderr else asyncio.subprocess.DEVNULL,
         )
     except FileNotFoundError:
         raise CLINotFoundError(
@@ -105,8 +111,8 @@ async def run_subprocess_async(cmd: List[str], input_text: str, name: str, *, ti
         raise CLITimeoutError(f"{name} CLI timed out after {timeout} seconds")
 
     if proc.returncode != 0:
-        error_msg = stderr.decode() if stderr else "Unknown error"
         if include_stderr:
+            error_msg = stderr.decode() if stderr else "Unknown error"
             raise CLIError(f"{name} CLI error: {error_msg}")
         raise CLIError(f"{name} CLI error")
 
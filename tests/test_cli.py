@@ -0,0 +1,45 @@
+"""Tests for the proxy launcher"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from claude_codex_proxy import cli
+
+
+def test_command_exists_keyed_on_path(monkeypatch, tmp_path):
+    exe = tmp_path / "fake-cli"
+    exe.write_text("#!/bin/sh\n")
+    exe.chmod(0o755)
+
+    monkeypatch.setenv("PATH", str(tmp_path))
+    assert cli.command_exists("fake-cli")
+
+    monkeypatch.setenv("PATH", str(tmp_path / "missing"))
+    assert not cli.command_exists("fake-cli")
+
+
+def test_run_event_loop_runs_coroutine():
+    result = []
+
+    async def coro():
+        result.append("ran")
+
+    cli.run_event_loop(coro())
+    assert result == ["ran"]
+
+
+def test_import_does_not_load_proxy_server():
+    code = (
+        "import sys, claude_codex_proxy.cli\n"
+        "assert 'claude_codex_proxy.proxy_server' not in sys.modules\n"
+        "assert 'mitmproxy' not in sys.modules\n"
+        "assert 'dotenv' not in sys.modules\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": str(Path(__file__).parents[1] / "src")},
+    )
+    assert result.returncode == 0, result.stderr
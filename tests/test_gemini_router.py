@@ -0,0 +1,82 @@
+"""Tests for Gemini routing"""
+import pytest
+
+from claude_codex_proxy import gemini_router
+from claude_codex_proxy.gemini_client import GeminiClient
+
+
+def test_local_mode_shares_client():
+    gemini_router.configure(api_key="99999999")
+    first = gemini_router.GenerativeModel("gemini-pro")
+    second = gemini_router.GenerativeModel("gemini-pro")
+    assert first._is_local_mode
+    assert isinstance(first.client, GeminiClient)
+    assert first.client is second.client
+
+
+def test_reconfigure_switches_mode():
+    gemini_router.configure(api_key="99999999")
+    assert gemini_router.GenerativeModel("gemini-pro")._is_local_mode
+    gemini_router.configure(api_key="real-key")
+    model = gemini_router.GenerativeModel("gemini-pro")
+    assert not model._is_local_mode
+    assert model.client is None
+
+
+def test_local_generate_content_uses_default_config(monkeypatch):
+    gemini_router.configure(api_key="99999999")
+    default_config = {"temperature": 0.1}
+    model = gemini_router.GenerativeModel("gemini-pro", generation_config=default_config)
+    captured = {}
+
+    def fake_generate_content(**kwargs):
+        captured.update(kwargs)
+        return "ok"
+
+    monkeypatch.setattr(model.client, "generate_content", fake_generate_content)
+
+    assert model.generate_content("hi") == "ok"
+    assert captured["generation_config"] is default_config
+
+    override = {"temperature": 0.9}
+    model.generate_content("hi", generation_config=override)
+    assert captured["generation_config"] is override
+
+
+def test_local_stream_not_supported():
+    gemini_router.configure(api_key="99999999")
+    model = gemini_router.GenerativeModel("gemini-pro")
+    with pytest.raises(NotImplementedError):
+        model.generate_content("hi", stream=True)
+
+
+def test_existing_model_keeps_backend_after_reconfigure():
+    gemini_router.configure(api_key="99999999")
+    local_model = gemini_router.GenerativeModel("gemini-pro")
+    gemini_router.configure(api_key="real-key")
+    remote_model = gemini_router.GenerativeModel("gemini-pro")
+
+    assert local_model._is_local_mode and local_model._real_model is None
+    assert not remote_model._is_local_mode and remote_model._real_model is not None
+
+
+def test_generative_model_has_no_instance_dict():
+    gemini_router.configure(api_key="99999999")
+    model = gemini_router.GenerativeModel("gemini-pro")
+    assert not hasattr(model, "__dict__")
+
+
+@pytest.mark.asyncio
+async def test_sync_stream_rejected_inside_event_loop():
+    gemini_router.configure(api_key="real-key")
+    model = gemini_router.GenerativeModel("gemini-pro")
+    with pytest.raises(NotImplementedError):
+        model.generate_content("hi", stream=True)
+
+
+def test_is_all_nines():
+    assert gemini_router._is_all_nines("9" * 39)
+    assert not gemini_router._is_all_nines("9" * 38 + "a")
+    assert not gemini_router._is_all_nines("9999é")
+    assert not gemini_router._is_all_nines("")
+    assert not gemini_router._is_all_nines(None)
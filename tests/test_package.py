@@ -0,0 +1,23 @@
+"""Tests for package-level exports"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+
+def test_package_exports_load_lazily():
+    code = (
+        "import sys, claude_codex_proxy as p\n"
+        "assert 'claude_codex_proxy.gemini_router' not in sys.modules\n"
+        "assert p.OpenAIRouter.__name__ == 'OpenAIRouter'\n"
+        "assert 'claude_codex_proxy.gemini_router' not in sys.modules\n"
+        "assert p.configure_gemini.__name__ == 'configure'\n"
+        "assert all(hasattr(p, name) for name in p.__all__)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": str(Path(__file__).parents[1] / "src")},
+    )
+    assert result.returncode == 0, result.stderr
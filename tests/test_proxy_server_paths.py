@@ -38,3 +38,16 @@ def test_custom_paths_override():
         interceptor._validate_request(DummyFlow("/v1/completions"))["error"]["type"]
         == "not_found"
     )
+
+
+def test_path_decisions_are_cached():
+    interceptor = proxy_server.AIInterceptor(DEFAULT_REGEX)
+    for _ in range(3):
+        assert interceptor._validate_request(DummyFlow("/v1/messages")) is None
+    assert interceptor._path_allowed.cache_info().hits == 2
+
+
+def test_duplicate_patterns_compiled_once():
+    regex = proxy_server.build_allowed_paths_regex([r"^/a$", r"^/b$", r"^/a$"])
+    assert regex.pattern == r"(?:^/a$)|(?:^/b$)"
+    assert regex.match("/b")
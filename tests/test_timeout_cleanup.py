@@ -19,7 +19,10 @@ SCRIPT_CMD = [sys.executable, SCRIPT]
 
 async def _fast_timeout(awaitable, timeout, *args, **kwargs):
     task = asyncio.create_task(awaitable)
-    await asyncio.sleep(0.05)
+    # Cancel as soon as the child has written its PID instead of sleeping
+    pid_file = Path(os.environ["PID_FILE"])
+    while not pid_file.exists() and not task.done():
+        await asyncio.sleep(0.001)
     task.cancel()
     with contextlib.suppress(BaseException):
         await task
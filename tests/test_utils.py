@@ -1,3 +1,5 @@
+import os
+
 import pytest
 from claude_codex_proxy import utils
 from claude_codex_proxy.utils import (
@@ -55,3 +57,46 @@ async def test_run_subprocess_async_error():
     cmd = ["python", "-c", "import sys; sys.exit(1)"]
     with pytest.raises(CLIError):
         await run_subprocess_async(cmd, "", "Fail")
+
+
+def test_is_all_nines_api_key_mixed_digits():
+    assert not utils.is_all_nines_api_key("9999a9")
+    assert not utils.is_all_nines_api_key("sk-999-123")
+    assert utils.is_all_nines_api_key("sk-123-999")
+
+
+@pytest.mark.asyncio
+async def test_run_subprocess_async_discards_stderr_when_excluded():
+    cmd = ["python", "-c", "import sys; sys.stderr.write('boom'); sys.exit(1)"]
+    with pytest.raises(CLIError) as exc_info:
+        await run_subprocess_async(cmd, "", "Fail", include_stderr=False)
+    assert "boom" not in str(exc_info.value)
+
+
+@pytest.mark.asyncio
+async def test_run_subprocess_async_returns_stdout_without_stderr_pipe():
+    cmd = ["python", "-c", "import sys; sys.stderr.write('noise'); print(sys.stdin.read())"]
+    assert await run_subprocess_async(cmd, "hello", "Echo", include_stderr=False) == "hello"
+
+
+def test_load_env_reads_dotenv_once(monkeypatch, tmp_path):
+    (tmp_path / ".env").write_text("CCP_TEST_VAR=loaded\n")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("CCP_TEST_VAR", raising=False)
+    monkeypatch.delenv(utils.ENV_LOADED_VAR, raising=False)
+    monkeypatch.setattr(utils, "_env_loaded", False)
+
+    utils.load_env()
+    assert os.environ["CCP_TEST_VAR"] == "loaded"
+    assert os.environ[utils.ENV_LOADED_VAR] == "1"
+
+
+def test_load_env_skips_when_already_loaded(monkeypatch, tmp_path):
+    (tmp_path / ".env").write_text("CCP_TEST_VAR=loaded\n")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("CCP_TEST_VAR", raising=False)
+    monkeypatch.setenv(utils.ENV_LOADED_VAR, "1")
+    monkeypatch.setattr(utils, "_env_loaded", False)
+
+    utils.load_env()
+    assert "CCP_TEST_VAR" not in os.environ